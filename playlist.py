@@ -1,6 +1,8 @@
 class Playlist:
     """Playlist represents a Spotify playlist."""
 
+    __slots__ = ("name", "id")
+
     def __init__(self, name, id):
         """
         :param name (str): Playlist name
@@ -1,59 +1,215 @@
+import asyncio
 import json
+import math
 import os
 import re
-import time
 
+import aiohttp
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 from track import Track
 from playlist import Playlist
 
+# valid Spotify IDs are 22 url-safe base64 chars; these strip an optional URI prefix
+_ALBUM_URI_RE = re.compile(r"(spotify:album:|spotify:.*:album:)(?=[0-9A-Za-z_-]{22}$)")
+_PLAYLIST_URI_RE = re.compile(r"^(spotify:playlist:|spotify:.*:playlist:)(?=[0-9A-Za-z_-]{22}$)")
+
+# returned by get_playing for 204 No Content: nothing is playing, and polling
+# again will not change that without user action
+NOT_PLAYING = object()
+
+# process-wide aiohttp session shared by all clients that were not handed their
+# own, so connections to api.spotify.com (and their TLS handshakes) are reused
+# across SpotifyClient instances
+_GLOBAL_SESSION = None
+_GLOBAL_LOOP = None
+
+
+async def _global_session():
+    global _GLOBAL_SESSION, _GLOBAL_LOOP
+    loop = asyncio.get_running_loop()
+    if _GLOBAL_SESSION is None or _GLOBAL_SESSION.closed or _GLOBAL_LOOP is not loop:
+        _GLOBAL_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=30, keepalive_timeout=60)
+        )
+        _GLOBAL_LOOP = loop
+    return _GLOBAL_SESSION
+
+
+class TransientError(Exception):
+    """A retryable API failure (5xx server error)."""
+
 
 class SpotifyClient:
     """SpotifyClient performs operations using the Spotify API."""
     market = "DE"
 
-    def __init__(self, authorization_token, user_id, market_="DE"):
+    # one token flows back into the bucket this often (seconds)
+    _refill_interval = 0.5
+
+    def __init__(self, authorization_token, user_id, market_="DE", rate_limit=10, session=None):
         """
         :param authorization_token: Spotify API token
         :param user_id: Spotify user id
         :param market_: Synonym for country. An ISO 3166-1 alpha-2 country code or the string from_token.
         Supply this parameter to limit the response to one particular geographical market.
         For example, for albums available in Sweden: market=SE.
+        :param rate_limit: Maximum number of API requests in flight at once. Together with the
+        refill interval this keeps the effective request rate under Spotify's limit.
+        :param session: Optional aiohttp.ClientSession to use instead of the shared
+        module-level one. Callers who inject a session also own closing it.
         """
         self._authorization_token = authorization_token
         # self._authorization_token = "------"
         self._user_id = user_id
         self.market = market_
+        self._rate_limit = rate_limit
+        # auth goes per-request because the aiohttp session is shared between
+        # clients (and therefore between tokens)
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self._authorization_token}"
+        }
+        self._injected_session = session
+        self._loop = None
+        self._sem = None
+        self._refill_task = None
+        # long-lived cache of context track lists, keyed by (kind, id, market);
+        # a hit saves the whole paginated fetch on repeated context lookups
+        self._track_cache = {}
+        # uri -> position maps derived from _track_cache entries, built lazily
+        # so offset lookups are O(1) instead of scanning with .index()
+        self._positions_cache = {}
+        # (type, uri) of the last context seen, used to prefetch speculatively
+        self._last_context = None
+        # one session for the synchronous endpoints: keep-alive connections
+        # amortise the TLS handshake across calls instead of paying it per request
+        self._sync_session = requests.Session()
+        self._sync_session.headers.update({
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self._authorization_token}"
+        })
+        self._sync_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
 
-    def _place_get_api_request(self, url):
-        response = requests.get(
-            url,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self._authorization_token}"
-            }
-        )
-        return response
+    def close(self):
+        self._sync_session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self._teardown()
+        self.close()
+
+    def _run(self, coro):
+        """
+        Drive a coroutine from synchronous code.
+        asyncio.run closes its event loop on exit, so the shared aiohttp session
+        has to be torn down with it - a fresh one is created lazily on the next
+        call. Long-running async apps avoid this churn by calling the *_async
+        coroutines directly.
+        """
+        async def runner():
+            try:
+                return await coro
+            finally:
+                await self._teardown()
+                if self._injected_session is None:
+                    # the loop owning the shared session's connections is about
+                    # to close, so the session cannot outlive this call
+                    await self.close_global_session()
+        return asyncio.run(runner())
+
+    async def _ensure_session(self):
+        loop = asyncio.get_running_loop()
+        if self._sem is None or self._loop is not loop:
+            self._loop = loop
+            self._sem = asyncio.BoundedSemaphore(self._rate_limit)
+            self._refill_task = asyncio.create_task(self._refill())
+        if self._injected_session is not None:
+            return self._injected_session
+        return await _global_session()
+
+    async def _refill(self):
+        """Leaky bucket: requests take a token from the semaphore and this task
+        drips them back at a fixed rate, so bursts of gathered pages cannot
+        exceed the steady-state request rate."""
+        while True:
+            await asyncio.sleep(self._refill_interval)
+            try:
+                self._sem.release()
+            except ValueError:
+                # bucket already full
+                pass
+
+    async def _teardown(self):
+        """Tear down this client's per-loop state (rate limiter and refill
+        task). The shared module-level session is deliberately left alone -
+        other clients may still be using it - and is closed once at shutdown
+        via close_global_session()."""
+        if self._refill_task is not None:
+            self._refill_task.cancel()
+            self._refill_task = None
+        self._loop = None
+        self._sem = None
+
+    @classmethod
+    async def close_global_session(cls):
+        """Close the process-wide shared session on clean shutdown."""
+        global _GLOBAL_SESSION
+        if _GLOBAL_SESSION is not None and not _GLOBAL_SESSION.closed:
+            await _GLOBAL_SESSION.close()
+        _GLOBAL_SESSION = None
+
+    async def _get(self, url):
+        session = await self._ensure_session()
+        while True:
+            await self._sem.acquire()
+            async with session.get(url, headers=self._headers) as response:
+                if response.status == 429:
+                    # rate limited anyway - honour Retry-After and go again
+                    retry_after = float(response.headers.get("Retry-After", 1))
+                elif response.status == 204:
+                    # nothing to report, but everything fine
+                    return None
+                else:
+                    if response.status >= 500:
+                        # server-side hiccup, worth retrying
+                        raise TransientError(response.status)
+                    if response.status >= 400:
+                        # something bad happened
+                        print(response)
+                        raise Exception(response)
+                    return await response.json(loads=orjson.loads)
+            await asyncio.sleep(retry_after)
+
+    async def _post(self, url, data=None):
+        session = await self._ensure_session()
+        while True:
+            await self._sem.acquire()
+            async with session.post(url, data=data, headers=self._headers) as response:
+                if response.status == 429:
+                    # rate limited anyway - honour Retry-After and go again
+                    retry_after = float(response.headers.get("Retry-After", 1))
+                elif response.status == 204:
+                    return response.status, None
+                else:
+                    return response.status, await response.json(loads=orjson.loads)
+            await asyncio.sleep(retry_after)
 
     def _place_post_api_request(self, url, data=None):
         if not data:
-            response = requests.post(
-                url,
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {self._authorization_token}"
-                }
-            )
+            response = self._sync_session.post(url)
         else:
-            response = requests.post(
-                url,
-                data=data,
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {self._authorization_token}"
-                }
-            )
+            response = self._sync_session.post(url, data=data)
 
         return response
 
@@ -65,22 +221,18 @@ class SpotifyClient:
         For example, for albums available in Sweden: market=SE.
         It can also be globally set for the whole SpotifyClient object.
         """
+        return self._run(self.get_playing_async(market))
+
+    async def get_playing_async(self, market=market):
+        """Coroutine behind get_playing. Returns the NOT_PLAYING sentinel when
+        the player reports 204 and raises TransientError on 5xx."""
         url = f"https://api.spotify.com/v1/me/player/currently-playing?market={market}&additional_types=track,episode"
-        response = self._place_get_api_request(url)
-        if response.status_code >= 400:
-            # something bad happened
-            print(response)
-            raise Exception(response)
-        if response.status_code == 204:
-            # nothing to report, but everything fine
+        payload = await self._get(url)
+        if payload is None:
+            # 204: nothing to report, but everything fine
             print("nothing playing")
-            return
-        if response.status_code == 200:
-            return response.json()
-
-        print("Wut?\n")
-        print("response")
-        return
+            return NOT_PLAYING
+        return payload
 
     def get_album_songs(self, album_uri, market=market, limit=50):
         """
@@ -92,23 +244,126 @@ class SpotifyClient:
         It can also be globally set for the whole SpotifyClient object.
         :param limit: The maximum number of tracks to return. Default: 50. Minimum: 1. Maximum: 50
         """
-        # album_uri = album_uri.removeprefix('spotify:album:')
-        # pattern = r"^spotify:album:"
-        pattern = r"(spotify:album:|spotify:.*:album:)(?=[0-9A-Za-z_-]{22}$)"
-        album_uri = re.sub(pattern, "", album_uri)
+        return self._run(self.get_album_songs_async(album_uri, market, limit))
+
+    async def get_album_songs_async(self, album_uri, market=market, limit=50):
+        """Coroutine behind get_album_songs. Fetches the first page to learn the
+        total track count, then pulls all remaining pages in parallel instead of
+        walking the 'next' links one round trip at a time."""
+        album_uri = _ALBUM_URI_RE.sub("", album_uri)
+        cache_key = ("album", album_uri, market)
+        if cache_key in self._track_cache:
+            return self._track_cache[cache_key]
+        # only the URIs are used, so don't ask for full track objects (~10x smaller pages)
+        base_url = f"https://api.spotify.com/v1/albums/{album_uri}/tracks?market={market}&fields=items(uri),total,limit&limit={limit}"
+        first_page = await self._get(base_url)
+        pages = await self._fetch_remaining_pages(base_url, first_page)
         songs = []
-        next = f"https://api.spotify.com/v1/albums/{album_uri}/tracks?market={market}&limit={limit}"
-        while next:
-            response = self._place_get_api_request(next)
-            response = response.json()
-
-            for song in response['items']:
+        for page in pages:
+            for song in page['items']:
                 songs.append(song['uri'])
-
-            next = response['next']
             # album with 100 songs 0evSqptUFUbxZjrtgSwZAq
+        songs = tuple(songs)
+        self._track_cache[cache_key] = songs
         return songs
 
+    async def iter_album_songs(self, album_uri, market=market, limit=50):
+        """Yield album track URIs page by page by following the 'next' links,
+        so callers that stop early never pay for the remaining pages."""
+        album_uri = _ALBUM_URI_RE.sub("", album_uri)
+        next_url = f"https://api.spotify.com/v1/albums/{album_uri}/tracks?market={market}&fields=items(uri),next&limit={limit}"
+        while next_url:
+            page = await self._get(next_url)
+            for song in page['items']:
+                yield song['uri']
+            next_url = page['next']
+
+    async def iter_playlist_songs(self, playlist_uri, market=market, limit=100):
+        """Yield playlist track URIs page by page, like iter_album_songs."""
+        playlist_uri = _PLAYLIST_URI_RE.sub("", playlist_uri)
+        next_url = f"https://api.spotify.com/v1/playlists/{playlist_uri}/tracks?market={market}&fields=items(track(uri)),next&limit={limit}&additional_types=track,episode"
+        while next_url:
+            page = await self._get(next_url)
+            for song in page['items']:
+                yield song['track']['uri']
+            next_url = page['next']
+
+    async def _warm_context(self, context_type, context_uri, market):
+        """Speculatively fill the track cache for a context. Failures are
+        swallowed - if the guess was wrong or the fetch broke, the real offset
+        lookup fetches again on its own."""
+        try:
+            if context_type == 'album':
+                await self.get_album_songs_async(context_uri, market)
+            elif context_type == 'playlist':
+                await self.get_playlist_songs_async(context_uri, market)
+        except Exception:
+            pass
+
+    def _positions_for(self, cache_key, songs):
+        """uri -> position map for a cached track list, built once per context."""
+        positions = self._positions_cache.get(cache_key)
+        if positions is None:
+            positions = {uri: position for position, uri in enumerate(songs)}
+            self._positions_cache[cache_key] = positions
+        return positions
+
+    def get_album_song_positions(self, album_uri, market=market):
+        """
+        Map every track URI in an album to its position, memoized per
+        (album, market). Dict lookups on the result are O(1), unlike
+        .index() on the track list.
+        """
+        return self._run(self.get_album_song_positions_async(album_uri, market))
+
+    async def get_album_song_positions_async(self, album_uri, market=market):
+        songs = await self.get_album_songs_async(album_uri, market)
+        cache_key = ("album", _ALBUM_URI_RE.sub("", album_uri), market)
+        return self._positions_for(cache_key, songs)
+
+    def get_playlist_song_positions(self, playlist_uri, market=market):
+        """Map every track URI in a playlist to its position, like
+        get_album_song_positions."""
+        return self._run(self.get_playlist_song_positions_async(playlist_uri, market))
+
+    async def get_playlist_song_positions_async(self, playlist_uri, market=market):
+        songs = await self.get_playlist_songs_async(playlist_uri, market)
+        cache_key = ("playlist", _PLAYLIST_URI_RE.sub("", playlist_uri), market)
+        return self._positions_for(cache_key, songs)
+
+    async def _find_context_offset(self, context_type, context_uri, item_uri, market):
+        """Resolve the position of item_uri inside its album/playlist context.
+        A cached context answers with one dict lookup; otherwise the pages are
+        streamed and the scan stops at the first match instead of downloading
+        the whole context just to search it."""
+        if context_type == 'album':
+            cache_key = ("album", _ALBUM_URI_RE.sub("", context_uri), market)
+        else:
+            cache_key = ("playlist", _PLAYLIST_URI_RE.sub("", context_uri), market)
+        songs = self._track_cache.get(cache_key)
+        if songs is not None:
+            return self._positions_for(cache_key, songs)[item_uri]
+
+        if context_type == 'album':
+            song_iter = self.iter_album_songs(context_uri, market)
+        else:
+            song_iter = self.iter_playlist_songs(context_uri, market)
+        offset = 0
+        async for uri in song_iter:
+            if uri == item_uri:
+                return offset
+            offset += 1
+        raise ValueError(f"{item_uri} not found in {context_uri}")
+
+    async def _fetch_remaining_pages(self, base_url, first_page):
+        """Given the first page of a paginated endpoint, fetch every other page
+        concurrently and return all pages in offset order."""
+        total = first_page['total']
+        limit = first_page['limit']
+        offsets = [limit * n for n in range(1, math.ceil(total / limit))]
+        tasks = [self._get(f"{base_url}&offset={offset}") for offset in offsets]
+        return [first_page] + list(await asyncio.gather(*tasks))
+
     def get_playlist_songs(self, playlist_uri, market=market, limit=100):
         """
         Get the content of an album and strip everything but the Spotify URI
@@ -119,20 +374,24 @@ class SpotifyClient:
         It can also be globally set for the whole SpotifyClient object.
         :param limit: The maximum number of tracks to return. Default: 100. Minimum: 1. Maximum: 100
         """
-        # album_uri = album_uri.removeprefix('spotify:playlist:')
-        pattern = r"^(spotify:playlist:|spotify:.*:playlist:)(?=[0-9A-Za-z_-]{22}$)"
-        playlist_uri = re.sub(pattern, "", playlist_uri)
+        return self._run(self.get_playlist_songs_async(playlist_uri, market, limit))
+
+    async def get_playlist_songs_async(self, playlist_uri, market=market, limit=100):
+        """Coroutine behind get_playlist_songs. Same parallel pagination scheme
+        as get_album_songs_async."""
+        playlist_uri = _PLAYLIST_URI_RE.sub("", playlist_uri)
+        cache_key = ("playlist", playlist_uri, market)
+        if cache_key in self._track_cache:
+            return self._track_cache[cache_key]
+        base_url = f"https://api.spotify.com/v1/playlists/{playlist_uri}/tracks?market={market}&fields=items(track(uri)),total,limit&limit={limit}&additional_types=track,episode"
+        first_page = await self._get(base_url)
+        pages = await self._fetch_remaining_pages(base_url, first_page)
         songs = []
-        next = f"https://api.spotify.com/v1/playlists/{playlist_uri}/tracks?market={market}&fields=items(track(uri)),next&limit={limit}&additional_types=track,episode"
-        while next:
-            response = self._place_get_api_request(next)
-            response = response.json()
-
-            for song in response['items']:
+        for page in pages:
+            for song in page['items']:
                 songs.append(song['track']['uri'])
-
-            next = response['next']
-
+        songs = tuple(songs)
+        self._track_cache[cache_key] = songs
         return songs
 
     def get_track_recommendations(self, seed_tracks, limit=50):
@@ -142,13 +401,14 @@ class SpotifyClient:
         :param limit: Number of recommended tracks to be returned
         :return tracks (list of Track): List of recommended tracks
         """
-        seed_tracks_url = ""
-        for seed_track in seed_tracks:
-            seed_tracks_url += seed_track.id + ","
-        seed_tracks_url = seed_tracks_url[:-1]
-        url = f"https://api.spotify.com/v1/recommendations?seed_tracks={seed_tracks_url}&limit={limit}"
-        response = self._place_get_api_request(url)
-        response_json = response.json()
+        response = self._sync_session.get(
+            "https://api.spotify.com/v1/recommendations",
+            params={
+                "seed_tracks": ",".join(seed_track.id for seed_track in seed_tracks),
+                "limit": limit
+            }
+        )
+        response_json = orjson.loads(response.content)
         tracks = [Track(track["name"], track["id"], track["artists"][0]["name"]) for
                   track in response_json["tracks"]]
         return tracks
@@ -165,7 +425,7 @@ class SpotifyClient:
         })
         url = f"https://api.spotify.com/v1/users/{self._user_id}/playlists"
         response = self._place_post_api_request(url, data)
-        response_json = response.json()
+        response_json = orjson.loads(response.content)
 
         # create playlist
         playlist_id = response_json["id"]
@@ -177,14 +437,24 @@ class SpotifyClient:
 
         :param playlist: Playlist to which to add tracks
         :param tracks: (list of Track) Tracks to be added to playlist
-        :return response: API response
+        :return responses: (list) API response per 100-track chunk
         """
-        track_uris = [track.create_spotify_uri() for track in tracks]
-        data = json.dumps(track_uris)
+        return self._run(self.populate_playlist_async(playlist, tracks))
+
+    async def populate_playlist_async(self, playlist, tracks):
+        """Coroutine behind populate_playlist. The tracks endpoint accepts at
+        most 100 URIs per request, so larger lists are split into 100-track
+        chunks. The chunks are POSTed one after another - appends land in
+        arrival order, so firing them concurrently would scramble the
+        playlist."""
+        track_uris = [track.uri for track in tracks]
         url = f"https://api.spotify.com/v1/playlists/{playlist.id}/tracks"
-        response = self._place_post_api_request(url, data)
-        response_json = response.json()
-        return response_json
+        responses = []
+        for i in range(0, len(track_uris), 100):
+            chunk = track_uris[i:i + 100]
+            _, payload = await self._post(url, data=json.dumps(chunk))
+            responses.append(payload)
+        return responses
 
     def get_playing_with_context(self, market=market):
         """
@@ -194,29 +464,63 @@ class SpotifyClient:
         For example, for albums available in Sweden: market=SE.
         It can also be globally set for the whole SpotifyClient object.
         """
+        return self._run(self.get_playing_with_context_async(market))
+
+    async def get_playing_with_context_async(self, market=market):
+        """Coroutine behind get_playing_with_context. Polls with exponential
+        backoff (50ms doubling up to 1s) instead of a fixed blocking half-second
+        sleep, so a quick answer costs milliseconds and other tasks can run
+        during the waits."""
+        prefetch = None
+        prefetch_context = self._last_context
+        if prefetch_context is not None:
+            # speculatively warm the track cache for the last seen context while
+            # we poll the player; the fetch overlaps the waiting below and costs
+            # nothing extra if the context has not changed
+            prefetch = asyncio.create_task(self._warm_context(*prefetch_context, market))
 
         test = None
-
-        i = 10
-        while test is None and i > 0:
-            i -= 1
-            time.sleep(0.5)
-            test = self.get_playing(market)
-            # print(test)
-        if test is None:
+        delay = 0.05
+        for _ in range(10):
+            try:
+                test = await self.get_playing_async(market)
+                # print(test)
+                break
+            except TransientError:
+                # server-side hiccup - back off and retry
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 1.0)
+        if test is None or test is NOT_PLAYING:
+            # NOT_PLAYING is terminal: a paused player stays paused without
+            # user action, so retrying would only burn up to 5 seconds
+            if prefetch is not None:
+                prefetch.cancel()
             return
 
         output = {'item': {'uri': test['item']['uri'], 'duration_ms': test['item']['duration_ms']},
                   'progress_ms': test['progress_ms'], 'is_playing': test['is_playing']}
 
+        if prefetch is not None:
+            if (test['context'] is not None
+                    and (test['context']['type'], test['context']['uri']) == prefetch_context):
+                # guessed right - let the warm-up finish so the offset lookup
+                # below hits the cache
+                try:
+                    await asyncio.wait_for(prefetch, timeout=10)
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                prefetch.cancel()
+
         if test['context'] is not None:
 
+            self._last_context = (test['context']['type'], test['context']['uri'])
             output.update({'context': {'type': test['context']['type'], 'uri': test['context']['uri']}})
 
-            if test['context']['type'] == 'album':
-                output.update({'context': {'offset': self.get_album_songs(test['context']['uri'], market).index(test['item']['uri'])}})
-            elif test['context']['type'] == 'playlist':
-                output.update({'context': {'offset': self.get_playlist_songs(test['context']['uri'], market).index(test['item']['uri'])}})
+            if test['context']['type'] in ('album', 'playlist'):
+                offset = await self._find_context_offset(
+                    test['context']['type'], test['context']['uri'], test['item']['uri'], market)
+                output.update({'context': {'offset': offset}})
 
         else:
             output['context'] = None
@@ -224,35 +528,35 @@ class SpotifyClient:
         return output
 
     def skip(self, tracks: int):
-        if tracks is 0:
+        return self._run(self.skip_async(tracks))
+
+    async def skip_async(self, tracks: int):
+        """
+        Skip forward (positive) or backward (negative) by the given number of tracks.
+        The player queue only moves one way per endpoint, so the POSTs are
+        independent and can all be fired at once instead of interleaving each
+        one with a verification GET.
+        """
+        if tracks == 0:
             return
 
-        data = None
-        check = self.get_playing()
-        if check is None:
+        check = await self.get_playing_async()
+        if check is NOT_PLAYING:
             return
         check = check['item']['uri']
 
         if tracks > 0:  # skip to next
-
             url = f"https://api.spotify.com/v1/me/player/next"
-            while tracks != 0:
-                if self._place_post_api_request(url, data).status_code != 204:
-                    # something bad happened
-                    raise Exception()
-                check_ = check
-                check = self.get_playing("DE")['item']['uri']
-                if check_ is not check:
-                    tracks -= 1
+        else:  # skip to previous
+            url = f"https://api.spotify.com/v1/me/player/previous"
 
-        elif tracks < 0:  # skip to previous
+        responses = await asyncio.gather(*[self._post(url) for _ in range(abs(tracks))])
+        for status, _ in responses:
+            if status != 204:
+                # something bad happened
+                raise Exception()
 
-            url = f"https://api.spotify.com/v1/me/player/previous"
-            while tracks != 0:
-                if self._place_post_api_request(url, data).status_code != 204:
-                    # something bad happened
-                    raise Exception()
-                check_ = check
-                check = self.get_playing("DE")['item']['uri']
-                if check_ is not check:
-                    tracks += 1
+        # verify once at the end instead of after every single skip
+        check_ = await self.get_playing_async(self.market)
+        if check_ is not NOT_PLAYING and check_['item']['uri'] == check:
+            print("player did not advance")
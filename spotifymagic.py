@@ -1,3 +1,4 @@
+import asyncio
 import os
 import json
 import time
@@ -7,12 +8,17 @@ from spotifyclient import SpotifyClient
 from helpers import *
 
 
-def main():
-    spotify_client = SpotifyClient(os.getenv("SPOTIFY_AUTHORIZATION_TOKEN"),
-                                   os.getenv("SPOTIFY_USER_ID"))
-    test = spotify_client.get_playing_with_context()
-    spotify_client.skip(+3)
+async def main():
+    async with SpotifyClient(os.getenv("SPOTIFY_AUTHORIZATION_TOKEN"),
+                             os.getenv("SPOTIFY_USER_ID")) as spotify_client:
+        # the skip target doesn't depend on the context reply, so run both at
+        # once and hide the slower call behind the faster one (the context
+        # snapshot may race the skip, which is fine here)
+        test, _ = await asyncio.gather(spotify_client.get_playing_with_context_async(),
+                                       spotify_client.skip_async(+3))
+    # app exit: now it is safe to close the process-wide connection pool
+    await SpotifyClient.close_global_session()
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -1,6 +1,8 @@
 class Track:
     """Track represents a piece of music."""
 
+    __slots__ = ("name", "id", "artist", "_uri")
+
     def __init__(self, name, id, artist):
         """
         :param name (str): Track name
@@ -10,9 +12,17 @@ class Track:
         self.name = name
         self.id = id
         self.artist = artist
+        self._uri = None
+
+    @property
+    def uri(self):
+        """Spotify URI for this track, built once and reused."""
+        if self._uri is None:
+            self._uri = f"spotify:track:{self.id}"
+        return self._uri
 
     def create_spotify_uri(self):
-        return f"spotify:track:{self.id}"
+        return self.uri
 
     def __str__(self):
-        return self.name + " by " + self.artist
\ No newline at end of file
+        return self.name + " by " + self.artist